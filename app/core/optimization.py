@@ -5,6 +5,7 @@ Attributes:
     ref_points (dict): Reference points for benchmark problems.
 """
 # Import native packages
+from io import StringIO
 import os
 
 # Import pypi packages
@@ -14,7 +15,7 @@ import numpy as np
 from core.settings import settings
 from datamod.problems import Custom
 from optimod import set_optimization, solve_problem
-from optimod.performance import calculate_hypervolume, verify_results
+from optimod.performance import calculate_hypervolume, measure_error, verify_results
 from visumod import compare_pareto_fronts, vis_design_space, vis_objective_space, vis_objective_space_pcp
 
 class Optimization:
@@ -50,6 +51,7 @@ class Optimization:
 
         self.iterations = 0
         self.converged = False
+        self.problem = None
 
         # Obtain optimization setup
         self.algorithm, self.termination = set_optimization(model.n_obj)
@@ -89,7 +91,16 @@ class Optimization:
             self.range_in = self.surrogate.data.range_in
             self.function = self.surrogate.surrogate.predict_values
 
-        self.problem = Custom(self.function,self.range_in.T[0],self.range_in.T[1],self.model.n_obj,self.n_const)
+        if self.problem is None:
+            self.problem = Custom(self.function,self.range_in.T[0],self.range_in.T[1],self.model.n_obj,self.n_const)
+
+            # Objective columns of the verification response
+            self._resp_cols = slice(None,-self.problem.n_constr or None)
+        else:
+            # Only the function and the bounds change between iterations
+            self.problem.function = self.function
+            self.problem.xl = self.range_in.T[0]
+            self.problem.xu = self.range_in.T[1]
 
         if not self.direct:
             self.problem.norm_in = self.surrogate.data.norm_in
@@ -126,12 +137,18 @@ class Optimization:
         ps_true = self.model.evaluator.problem.pareto_set()
         pf_true = self.model.evaluator.problem.pareto_front()
         self.optimization_stats = {}
-        if not np.all(ps_true==None):
+        if ps_true is not None:
             if self.model.n_obj == 1:
-                self.optimization_stats["ps_error"] = 100*(ps_true-ps_calc)/ps_true
-        if not np.all(pf_true==None):
+                ps_error = np.subtract(ps_true,ps_calc)
+                ps_error *= 100
+                ps_error /= ps_true
+                self.optimization_stats["ps_error"] = ps_error
+        if pf_true is not None:
             if self.model.n_obj == 1:
-                self.optimization_stats["pf_error"] = 100*(pf_true-pf_calc)/pf_true
+                pf_error = np.subtract(pf_true,pf_calc)
+                pf_error *= 100
+                pf_error /= pf_true
+                self.optimization_stats["pf_error"] = pf_error
             else:
                 self.optimization_stats["hv_calc"] = calculate_hypervolume(pf_calc,self.ref_point)
                 self.optimization_stats["hv_true"] = calculate_hypervolume(pf_true,self.ref_point)
@@ -152,30 +169,30 @@ class Optimization:
         """
         Wrapper function to verify the optimized solutions.
         """        
+        opt_settings = settings["optimization"]
+
         if self.res is not None:
             # Evaluate randomly selected samples using surrogate
             verificiation_idx = verify_results(self.res.X, self.surrogate)
 
-            # Calculate error
-            response_F = self.surrogate.verification.response[:,:-self.problem.n_constr or None]
+            # Calculate error in a single preallocated buffer
+            response_F = self.surrogate.verification.response[:,self._resp_cols]
             self.optimum_model = response_F[-len(verificiation_idx):,:]
             self.optimum_surrogate = self.res.F[verificiation_idx]
-            self.error = np.abs((100*(self.optimum_model-self.optimum_surrogate)/self.optimum_model))
+            error = np.empty_like(self.optimum_model)
+            np.subtract(self.optimum_model,self.optimum_surrogate,out=error)
+            np.divide(error,self.optimum_model,out=error)
+            error *= 100
+            np.abs(error,out=error)
+            self.error = error
 
             # Evaluate selected measure
-            measure = settings["optimization"]["error"]
-            if measure == "max":
-                measured_error = self.error
-            elif measure == "mean":
-                measured_error = np.mean(self.error,0)
-            elif measure == "percentile":
-                measured_error = np.percentile(self.error,60,0,interpolation="lower")
-
-            self.error_measure = np.max(measured_error)
+            measure = opt_settings["error"]
+            self.error_measure = measure_error(self.error,measure)
 
             print(f"Optimization {measure} percent error: {self.error_measure:.2f}")
 
-            self.converged = self.error_measure <= settings["optimization"]["error_limit"]
+            self.converged = self.error_measure <= opt_settings["error_limit"]
 
         else:
             self.converged = False
@@ -195,18 +212,22 @@ class Optimization:
         path = os.path.join(settings["folder"],"logs",f"optimizatoin_iteration_{self.iterations}.txt")
 
         if self.res is not None:
+            # Assemble the report in memory and flush it with a single write
+            buffer = StringIO()
+            buffer.write("======= F ========\n")
+            np.savetxt(buffer,self.res.F,fmt='%.6g')
+            buffer.write("\n======= X ========\n")
+            np.savetxt(buffer,self.res.X,fmt='%.6g')
+            if not self.direct:
+                buffer.write("\n======= VERIFICATION ========\n")
+                stats = np.concatenate((self.optimum_model,self.optimum_surrogate),1)
+                np.savetxt(buffer,stats,fmt='%.6g')
+                buffer.write("\n======= ERROR ========\n")
+                np.savetxt(buffer,self.error,fmt='%.6g')
+            buffer.write("\n")
+
             with open(path, "a") as file:
-                file.write("======= F ========\n")
-                np.savetxt(file,self.res.F,fmt='%.6g')
-                file.write("\n======= X ========\n")
-                np.savetxt(file,self.res.X,fmt='%.6g')
-                if not self.direct:
-                    file.write("\n======= VERIFICATION ========\n")
-                    stats = np.concatenate((self.optimum_model,self.optimum_surrogate),1)
-                    np.savetxt(file,stats,fmt='%.6g')
-                    file.write("\n======= ERROR ========\n")
-                    np.savetxt(file,self.error,fmt='%.6g')
-                file.write("\n")
+                file.write(buffer.getvalue())
 
 
             
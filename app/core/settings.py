@@ -6,13 +6,18 @@ Attributes:
 """
 
 # Import native packages
-from collections import Counter
+from copy import deepcopy
+from functools import lru_cache
+from glob import glob
+import hashlib
 import json
 import os
-from pathlib import Path
 import pickle
 from shutil import rmtree, copyfile
 
+# Import pypi packages
+import numpy as np
+
 def load_json(file):
     """
     Read a JSON file.
@@ -20,6 +25,25 @@ def load_json(file):
     Args:
         file (str): Path and name of the file to be loaded.
 
+    Returns:
+        data (dict): The loaded data.
+
+    Notes:
+        Parsed files are cached, keyed by modification time.
+    """
+    data = _load_json_cached(file,os.path.getmtime(file+".json"))
+
+    return deepcopy(data)
+
+@lru_cache(maxsize=64)
+def _load_json_cached(file,mtime):
+    """
+    Read and parse a JSON file, memoizing the result.
+
+    Args:
+        file (str): Path and name of the file to be loaded.
+        mtime (float): Modification time of the file, invalidates stale entries.
+
     Returns:
         data (dict): The loaded data.
     """
@@ -35,9 +59,30 @@ def dump_json(file,data):
     Args:
         file (str): Path and name of the file to be written.
         data (dict): The data to be saved.
+
+    Notes:
+        The file is replaced atomically so readers never see a partial write.
+        Numpy arrays and scalars are serialized directly.
     """
-    with open(file+".json","w") as f:
-          json.dump(data, f)
+    with open(file+".json.tmp","w") as f:
+          json.dump(data, f, default=_json_default, separators=(",",":"))
+    os.replace(file+".json.tmp",file+".json")
+
+def _json_default(obj):
+    """
+    Serialize the numpy types the standard json encoder rejects.
+
+    Args:
+        obj (any): Object not serializable by default.
+
+    Returns:
+        serializable (any): A JSON serializable equivalent.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 def get_input_from_id(problem_id,problem_folder):
     """
@@ -50,31 +95,51 @@ def get_input_from_id(problem_id,problem_folder):
     Returns:
         file (str): Path to the input file of the requested ID.
     """
-    matching_ids = [name for name in os.listdir(problem_folder) if name.startswith(str(problem_id).zfill(3))]
+    matching_ids = glob(os.path.join(problem_folder,str(problem_id).zfill(3)+"*.json"))
     if len(matching_ids) == 1:
-        file_name = matching_ids[0].replace(".json","")
+        file_name = os.path.basename(matching_ids[0]).replace(".json","")
     elif len(matching_ids) == 0:
         raise Exception(f"Input for ID {problem_id} undefined")
     else:
         raise Exception(f"ID {problem_id} input multiple defined")
 
-    if not (file_name[:3].isdigit() and file_name[3] is "-"):
+    if not (file_name[:3].isdigit() and file_name[3] == "-"):
         raise Exception('Invalid input file name, should start with "XXX-" where XXX is the problem ID')
 
     file = os.path.join(problem_folder,file_name)
 
     return file
 
+def input_hash(data):
+    """
+    Compute a stable hash of the input settings.
+
+    Args:
+        data (dict): The input settings.
+
+    Returns:
+        digest (str): Hexadecimal SHA-256 digest of the canonicalized settings.
+    """
+    digest = hashlib.sha256(json.dumps(data,sort_keys=True).encode()).hexdigest()
+
+    return digest
+
 def check_valid_settings():
     """
     Check if valid settings are used.
+
+    Notes:
+        The schema is read and compiled into frozensets only once per process.
     """
-    path = os.path.join(settings["root"],"app","config","inputs","valid_settings")
-    valid = load_json(path)
-    for i in valid.keys():
-        for j in valid[i].keys():
-            if j in settings[i].keys() and not (settings[i][j] in valid[i][j]):
-                raise Exception(f"Invalid setting for {j}, valid keys are: [{', '.join(valid[i][j])}]")
+    global _valid_settings
+    if _valid_settings is None:
+        path = os.path.join(settings["root"],"app","config","inputs","valid_settings")
+        _valid_settings = {i: {j: frozenset(values) for j, values in inner.items()} for i, inner in load_json(path).items()}
+
+    for i in _valid_settings.keys():
+        for j in _valid_settings[i].keys():
+            if j in settings[i].keys() and not (settings[i][j] in _valid_settings[i][j]):
+                raise Exception(f"Invalid setting for {j}, valid keys are: [{', '.join(str(value) for value in _valid_settings[i][j])}]")
 
 def update_settings(problem_id):
     """
@@ -129,12 +194,16 @@ def restart_check(id_current,file):
         else:
             path = os.path.join(data_folder,matching_folders[0])
         # Check whether the stored input file is identic
-        stored_input_path = os.path.join(path,"input")
-        
         new_input = load_json(file)
-        stored_input = load_json(stored_input_path)
-        
-        same_inputs = Counter(new_input) == Counter(stored_input)
+
+        hash_path = os.path.join(path,"input.sha256")
+        if os.path.isfile(hash_path):
+            # Compare the stored digest instead of the full dicts
+            with open(hash_path,"r") as f:
+                same_inputs = input_hash(new_input) == f.read().strip()
+        else:
+            stored_input = load_json(os.path.join(path,"input"))
+            same_inputs = new_input == stored_input
 
         if same_inputs:
             try:
@@ -167,8 +236,8 @@ def get_results_folders():
         all_result_folder (list): List of all results folders.
     """
     data_folder = os.path.join(settings["root"],"data")
-    all_result_folders = [name for name in next(os.walk(os.path.join(settings["root"],"data")))[1]]
-    
+    all_result_folders = [entry.name for entry in os.scandir(data_folder) if entry.is_dir()]
+
     return data_folder, all_result_folders
 
 def make_workfolder(file,fresh):
@@ -189,15 +258,17 @@ def make_workfolder(file,fresh):
     logs_path = os.path.join(folder_path,"logs")
 
     if fresh:
-        # Create folder, if not done yet
-        Path(folder_path).mkdir(parents=True,exist_ok=True) # parents in fact not needed   
-        Path(figures_path).mkdir(parents=True,exist_ok=True) # parents in fact not needed  
-        Path(logs_path).mkdir(parents=True,exist_ok=True) # parents in fact not needed
+        # Create folders, if not done yet - makedirs creates the parent folder implicitly
+        os.makedirs(figures_path,exist_ok=True)
+        os.makedirs(logs_path,exist_ok=True)
         if settings["surrogate"]["surrogate"].startswith("ann"):
-              Path(os.path.join(figures_path,"ann")).mkdir(parents=True,exist_ok=True) # parents in fact not needed  
+              os.makedirs(os.path.join(figures_path,"ann"),exist_ok=True)
 
-        # Copy the inputs file
+        # Copy the inputs file and store its digest for restart checks
         copyfile(file+".json",os.path.join(folder_path,"input.json"))
+        _load_json_cached.cache_clear()
+        with open(os.path.join(folder_path,"input.sha256"),"w") as f:
+            f.write(input_hash(load_json(file)))
 
     return folder_path
 
@@ -208,11 +279,20 @@ def dump_object(name,*args):
     Args:
         name (str): Path and name of the target file.
         args (any): Any object to be pickle dumped.
+
+    Notes:
+        Large buffers such as numpy arrays are written out-of-band, avoiding
+        an extra copy of them inside the pickle byte stream.
     """
     file = os.path.join(settings["folder"],"logs",f"{name}_dump.pkl")
     # Saving the objects:
-    with open(file, "wb") as f: 
-        pickle.dump(args, f)
+    buffers = []
+    payload = pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=buffers.append)
+    with open(file, "wb") as f:
+        pickle.dump([len(payload)]+[buffer.raw().nbytes for buffer in buffers], f)
+        f.write(payload)
+        for buffer in buffers:
+            f.write(buffer.raw())
 
 def load_object(name):
     """
@@ -227,10 +307,42 @@ def load_object(name):
     file = os.path.join(settings["folder"],"logs",f"{name}_dump.pkl")
     # Getting back the objects:
     with open(file, "rb") as f:
-        obj = pickle.load(f)
+        sizes = pickle.load(f)
+        payload = f.read(sizes[0])
+        buffers = [f.read(size) for size in sizes[1:]]
+    obj = pickle.loads(payload, buffers=buffers)
 
     return obj
 
+def dump_arrays(name,**arrays):
+    """
+    Saves the given arrays as a compressed numpy archive.
+
+    Args:
+        name (str): Path and name of the target file.
+        arrays (np.array): Arrays to be saved, keyed by name.
+
+    Notes:
+        Faster and smaller than pickle for purely numeric artifacts.
+    """
+    file = os.path.join(settings["folder"],"logs",f"{name}_arrays.npz")
+    np.savez_compressed(file,**arrays)
+
+def load_arrays(name):
+    """
+    Loads the saved numpy archive.
+
+    Args:
+        name (str): Path and name of the file to load.
+
+    Returns:
+        arrays (np.lib.npyio.NpzFile): The loaded arrays, read lazily per key.
+    """
+    file = os.path.join(settings["folder"],"logs",f"{name}_arrays.npz")
+    arrays = np.load(file)
+
+    return arrays
+
 def ask_to_overwrite(path,id_current,text):
     """
 
@@ -258,3 +370,6 @@ def ask_to_overwrite(path,id_current,text):
 # Initialize setting with the path to the root folder
 settings = {"root": os.path.split(__file__.split("app")[0])[0]}
 
+# Compiled valid settings schema, built on first check
+_valid_settings = None
+
@@ -31,6 +31,7 @@ class Surrogate:
         trained (bool): Whether the surrogate is trained.
         diverging (bool): Whether the amount of training samples has exceeded the maximal allowable.
         hp_optimized (bool): Whether the hyperparameters of the surrogate have been optimized.
+        hp_cache (dict): Optimal hyperparameters keyed by a training data signature.
         optimized_to_samples (int): Amount of training samples during last hyperparameter optimization.
         reoptimization_ratio (float): Sample increase ratio for reoptimization.
         no_samples (int): Current number of training samples.
@@ -38,6 +39,10 @@ class Surrogate:
         convergence_metric (dict): Dictionary of convergence metrics.
         file (str): Path to the training database.
         verification_file (str): Path to the verification database.
+        file_handles (dict): Persistent append handles to the database files.
+        status_path (str): Path to the status log.
+        logs_path (str): Path to the logs folder.
+        status (dict): In-memory copy of the status log.
         verification (datamod.get_data): Verfication samples.
         data (datamod.get_data): Training samples.
         range_norm (np.array): Range of validity in normalized coordinates.
@@ -62,24 +67,38 @@ class Surrogate:
         self.trained = False
         self.diverging = False
         self.hp_optimized = False
+        self.hp_cache = {}
         self.optimized_to_samples = 1     #Initialized with 1 to avoid division by zero
         self.reoptimization_ratio = settings["surrogate"]["reoptimization_ratio"]
         
         # Initialize sampling
         self.no_samples = 0
         self.sampling_iterations = 0
+        self.data = None
+        self.verification = None
 
-        # Initialize metrics
-        self.convergence_metric = {"name":settings["data"]["convergence"],"values":[]}
+        # Initialize metrics, values live in a preallocated buffer that doubles on demand
+        self._conv_buffer = np.empty(64)
+        self._conv_count = 0
+        self.convergence_metric = {"name":settings["data"]["convergence"],"values":self._conv_buffer[:0]}
 
         # Make response files
         self.file, self.verification_file = make_response_files(settings["folder"],self.model.dim_in,self.model.n_obj,self.model.n_const)
 
-        # Initialize log
+        # Cache the workfolder paths instead of rejoining them at every use
+        self.status_path = os.path.join(settings["folder"],"status")
+        self.logs_path = os.path.join(settings["folder"],"logs")
+
+        # Keep the database files open across sampling iterations
+        self.file_handles = {}
+
+        # Initialize log, the status is kept in memory and only written on save
         if not settings["surrogate"]["surrogate"] == "load":
-            initial_log = {"surrogate_trained":False,"range_in":self.model.range_in.tolist(),"dim_in":self.model.dim_in,"dim_out":self.model.dim_out,"n_const":self.model.n_const}
-            dump_json(os.path.join(settings["folder"],"status"),initial_log )
-        
+            self.status = {"surrogate_trained":False,"range_in":self.model.range_in,"dim_in":self.model.dim_in,"dim_out":self.model.dim_out,"n_const":self.model.n_const}
+            dump_json(self.status_path,self.status)
+        else:
+            self.status = None
+
     def sample(self):
         """
         Wrapper function to obtain the new sample points.
@@ -122,14 +141,43 @@ class Surrogate:
             file = self.file
 
         # Evaluate the samples
-        self.model.evaluator.generate_results(self.samples,file,self.sampling_iterations,verify)
+        self.model.evaluator.generate_results(self.samples,self.get_file_handle(file),self.sampling_iterations,verify)
+
+    def get_file_handle(self,file):
+        """
+        Retrieve a persistent append handle for the given database file.
+
+        Arguments:
+            file (str): Path and name of the database file.
+
+        Returns:
+            handle (file): Open append-mode handle.
+        """
+        if file not in self.file_handles:
+            self.file_handles[file] = open(file,"a")
+
+        return self.file_handles[file]
+
+    def flush_files(self):
+        """
+        Flush the persistent database handles so readers see all samples.
+        """
+        for handle in self.file_handles.values():
+            handle.flush()
 
     def append_verification(self):
         """
         Add verification results to database.
+
+        Notes:
+            The already parsed verification samples are appended from memory,
+            both to the database file and to the loaded training data.
         """
-        append_verification_to_database(self.file,self.verification_file)
-        
+        self.flush_files()
+        append_verification_to_database(self.file,self.verification_file,self.verification)
+        if self.verification is not None and self.data is not None:
+            self.data.append_data(self.verification.coordinates,self.verification.response)
+
     def load_results(self,verify=False):
         """
         Wrapper function to load the results from the results file
@@ -137,13 +185,18 @@ class Surrogate:
         Arguments:
             verify (bool):  whether this is a verification run
         """
+        self.flush_files()
         if verify:
             self.verification = get_data(self.verification_file)
         else:
-            # Read database
-            self.data = get_data(self.file)
+            # Read database, only the new rows after the first pass
+            if self.data is None:
+                self.data = get_data(self.file)
+            else:
+                self.data.refresh()
             # Plot the input data
-            plot_raw(self.data,self.sampling_iterations)
+            if self.should_plot():
+                plot_raw(self.data,self.sampling_iterations)
             # Set normalized range
             self.range_norm = (self.model.range_in.T/self.data.norm_in).T
 
@@ -159,7 +212,13 @@ class Surrogate:
         # Optimize hyperparameters
         if not self.hp_optimized:
             if self.name.startswith("ann"):
-                self.best_hp = optimize_hyperparameters(self.data,self.sampling_iterations)
+                # Skip the search if the same training data has been optimized already
+                key = (self.name,self.no_samples,hash(self.data.input.tobytes()))
+                if key in self.hp_cache:
+                    self.best_hp = self.hp_cache[key]
+                else:
+                    self.best_hp = optimize_hyperparameters(self.data,self.sampling_iterations)
+                    self.hp_cache[key] = self.best_hp
                 self.optimized_to_samples = self.no_samples
             else:
                 self.best_hp = None
@@ -177,8 +236,26 @@ class Surrogate:
         # Train the surrogate
         self.surrogate = train_surrogate(self.data,self.best_hp)
 
-        # Plot the surrogate response
-        compare_surrogate(self.data.input,self.data.output,self.surrogate.predict_values,self.sampling_iterations)
+        # Plot the surrogate response, predicted in one batched call
+        if self.should_plot():
+            predictions = self.surrogate.predict_values(self.data.input)
+            compare_surrogate(self.data.output,predictions,self.sampling_iterations)
+
+    def should_plot(self):
+        """
+        Determine whether the per-iteration training plots are made.
+
+        Returns:
+            plot (bool): Whether to produce the plots.
+
+        Notes:
+            With the optional plot_stride setting, figures are only rendered
+            every stride-th iteration and once the surrogate is trained.
+        """
+        stride = settings["data"]["plot_stride"] if "plot_stride" in settings["data"].keys() else 1
+        plot = self.trained or self.sampling_iterations % stride == 0
+
+        return plot
 
     def check_convergence(self):
         """
@@ -188,7 +265,11 @@ class Surrogate:
         self.surrogate.metric = retrieve_metric(self.surrogates)
 
         # Append convergence metric
-        self.convergence_metric["values"].append(self.surrogate.metric["mean"])
+        if self._conv_count == self._conv_buffer.shape[0]:
+            self._conv_buffer = np.concatenate((self._conv_buffer,np.empty_like(self._conv_buffer)))
+        self._conv_buffer[self._conv_count] = self.surrogate.metric["mean"]
+        self._conv_count += 1
+        self.convergence_metric["values"] = self._conv_buffer[:self._conv_count]
 
         # Check convergence
         self.trained = check_convergence(self.convergence_metric["values"])
@@ -257,13 +338,13 @@ class Surrogate:
         if len(inputs) > self.model.dim_in:
             raise Exception("Too many dimensions specified")
 
-        # Get response
-        input_norm = get_plotting_coordinates(density,inputs,self.model.dim_in,self.data.norm_in,self.range_norm,constants)
+        # Get response, contiguous input keeps the predictor on its fast path
+        input_norm = np.ascontiguousarray(get_plotting_coordinates(density,inputs,self.model.dim_in,self.data.norm_in,self.range_norm,constants))
         output_norm = self.surrogate.predict_values(input_norm)
 
-        # Unormalize
-        input_vec = scale(input_norm,self.data.norm_in)
-        output_vec = scale(output_norm,self.data.norm_out)
+        # Unormalize, in place since the normalized coordinates are no longer needed
+        input_vec = scale(input_norm,self.data.norm_in,out=input_norm)
+        output_vec = scale(output_norm,self.data.norm_out,out=output_norm)
 
         # Make plot
         surrogate_response(input_vec[:,inputs],output_vec[:,[output]],iteration)
@@ -278,25 +359,31 @@ class Surrogate:
             pass
 ##            dump_object("meta",self.surrogate)
 
-        status = load_json(os.path.join(settings["folder"],"status"))
-        to_update = {"surrogate_trained":True,"range_out":self.surrogate.range_out.tolist()}
-        status.update(to_update)
-        dump_json(os.path.join(settings["folder"],"status"),status)
+        to_update = {"surrogate_trained":True,"surrogate_name":self.name,"range_out":self.surrogate.range_out}
+        self.status.update(to_update)
+        dump_json(self.status_path,self.status)
 
     def reload(self):
         """
         Reloads the surrogate.
         """
-        status = load_json(os.path.join(settings["folder"],"status"))
+        self.status = status = load_json(self.status_path)
+
+        # Decide from the status payload, so tensorflow is only imported for a keras ANN
+        if "surrogate_name" in status:
+            is_ann = status["surrogate_name"] == "ann"
+        else:
+            is_ann = "ann" in os.listdir(self.logs_path)
+
+        if is_ann:
+            from metamod.ANN_tf import ANN ### import only when actually used, its slow due to tensorflow
+            from tensorflow.keras.models import load_model as load_keras_model
 
-        if "ann" in os.listdir(os.path.join(settings["folder"],"logs")):
-            from metamod.ANN import ANN ############################################
-            from tensorflow.keras.models import load_model as load_keras_model ############################################
-            
             interp = ANN()
             interp.nx = status["dim_in"]
             interp.ny = status["dim_out"]
-            interp.model = load_keras_model(os.path.join(settings["folder"],"logs","ann"))
+            # Inference only - skip recompiling the training graph and optimizer state
+            interp.model = load_keras_model(os.path.join(self.logs_path,"ann"),compile=False)
             interp.range_out = np.array(status["range_out"])
             interp.options["print_global"] = False
             self.surrogate = interp
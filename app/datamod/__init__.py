@@ -18,6 +18,7 @@ class get_data:
     Import data from an external file.
 
     Attributes:
+        file (str): Path and name of the database file.
         dim_in (int): Number of input dimensions.
         col_names (list): Names of columns.
         dim_out (int): Number of output dimensions.
@@ -36,6 +37,8 @@ class get_data:
         Args:
             file (str): Path and name of the database file.
         """
+        self.file = file
+
         # Load results
         self.dim_in, self.col_names, data = load_results(file)
         if len(data.shape) == 1:
@@ -56,6 +59,41 @@ class get_data:
         self.range_in = get_range(self.input)
         self.range_out = get_range(self.output)
 
+    def refresh(self):
+        """
+        Append the samples added to the database since the last read.
+
+        Notes:
+            Only the new rows are parsed, the already loaded rows are kept in memory.
+        """
+        new_data = load_results(self.file,skiprows=self.coordinates.shape[0])[2]
+        if new_data.size == 0:
+            return
+        if len(new_data.shape) == 1:
+            new_data = np.atleast_2d(new_data)
+
+        self.append_data(new_data[:,:self.dim_in],new_data[:,self.dim_in:])
+
+    def append_data(self,coordinates,response):
+        """
+        Append already parsed samples to the loaded data.
+
+        Args:
+            coordinates (np.array): Raw coordinates of the new samples.
+            response (np.array): Raw response of the new samples.
+        """
+        no_new = coordinates.shape[0]
+        self.coordinates = np.concatenate((self.coordinates,coordinates),0)
+        self.response = np.concatenate((self.response,response),0)
+
+        # Update the normalization factors with a running maximum
+        self.input, self.norm_in, rescaled_in = renormalize(self.input,self.coordinates,coordinates,self.norm_in)
+        self.output, self.norm_out, rescaled_out = renormalize(self.output,self.response,response,self.norm_out)
+
+        # Update the ranges from the new rows only, unless the factors changed
+        self.range_in = get_range(self.input) if rescaled_in else merge_range(self.range_in,get_range(self.input[-no_new:]))
+        self.range_out = get_range(self.output) if rescaled_out else merge_range(self.range_out,get_range(self.output[-no_new:]))
+
 def load_problem(name):
     """
     Load a pre-defined benchmark problem.
@@ -86,19 +124,20 @@ def load_problem(name):
     
     return problem, range_in, dim_in, dim_out, n_constr
 
-def scale(data,ranges):
+def scale(data,ranges,out=None):
     """
     Scale data from [-1,1] range to original range.
 
     Arguments:
         data (np.array): Data to scale.
         ranges (np.array): Normalization ranges.
+        out (np.array): Optional output buffer, reused instead of a new allocation.
 
     Returns (np.array):
         data_scale: Scaled data.
     """
-    data_scale = data*ranges
-    
+    data_scale = np.multiply(data,ranges,out=out)
+
     return data_scale
 
 def normalize(data):
@@ -114,13 +153,41 @@ def normalize(data):
     
     return sk_normalize(data, norm='max',axis=0,return_norm=True)
 
+def renormalize(normalized,raw,new_rows,norms):
+    """
+    Update normalized data with newly appended rows.
+
+    Arguments:
+        normalized (np.array): Previously normalized data.
+        raw (np.array): Full raw data including the new rows.
+        new_rows (np.array): Newly appended raw rows.
+        norms (np.array): Previous normalization factors.
+
+    Returns:
+        normalized (np.array): Normalized full data.
+        norms (np.array): Updated normalization factors.
+        rescaled (bool): Whether the factors changed and the data was rescaled.
+    """
+    norms_new = np.max(np.abs(new_rows),0)
+    rescaled = bool(np.any(norms_new > norms))
+
+    if rescaled:
+        # Factors changed, renormalize everything
+        norms = np.maximum(norms,norms_new)
+        normalized = raw/norms
+    else:
+        # Factors unchanged, only normalize the new rows
+        normalized = np.concatenate((normalized,new_rows/norms),0)
+
+    return normalized, norms, rescaled
+
 def get_range(data):
     """
     Determine the range of the data.
-    
+
     Arguments:
         data (np.array): Data to analyze.
-    
+
     Returns:
         ranges (np.array): Ranges of the given data.
     """
@@ -129,3 +196,20 @@ def get_range(data):
     ranges = np.stack((lower,upper),1)
 
     return ranges
+
+def merge_range(ranges,ranges_new):
+    """
+    Merge two data ranges into their running extremes.
+
+    Arguments:
+        ranges (np.array): Previously determined ranges.
+        ranges_new (np.array): Ranges of the newly added data.
+
+    Returns:
+        merged (np.array): Combined ranges.
+    """
+    lower = np.minimum(ranges[:,0],ranges_new[:,0])
+    upper = np.maximum(ranges[:,1],ranges_new[:,1])
+    merged = np.stack((lower,upper),1)
+
+    return merged
@@ -3,7 +3,9 @@ Contains the classes to evaluate the new samples, typically using an external so
 """
 
 # Import native packages
+from concurrent.futures import ProcessPoolExecutor
 import datetime
+from itertools import repeat
 import os
 import subprocess
 from time import sleep
@@ -86,13 +88,44 @@ class EvaluatorBenchmark(Evaluator):
 
         Warnings:
             Return_values_of in problem.evaluate doesn't work - Pymoo implementation problem.
+
+        Notes:
+            Benchmark evaluations are independent per sample, so the batch can be
+            split across worker processes when n_workers is set.
         """
         # Evaluate
-        response_all = self.problem.evaluate(samples,return_values_of=self.results,return_as_dictionary=True) # return_values_of doesn't work as expected
-        response = np.concatenate([response_all[column] for column in response_all if column in self.results], axis=1)
+        n_workers = settings["data"]["n_workers"] if "n_workers" in settings["data"].keys() else 1
+
+        if n_workers > 1 and samples.shape[0] >= n_workers:
+            chunks = np.array_split(samples,n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                responses = executor.map(evaluate_benchmark_chunk,repeat(self.problem),repeat(self.results),chunks)
+            response = np.concatenate(list(responses),axis=0)
+        else:
+            response = evaluate_benchmark_chunk(self.problem,self.results,samples)
 
         return response
 
+def evaluate_benchmark_chunk(problem,results,samples):
+    """
+    Evaluate a batch of samples on a benchmark problem.
+
+    Args:
+        problem (): Benchmark problem.
+        results (list): List of values requested from the problem.
+        samples (np.array): Samples to evaluate.
+
+    Returns:
+        response (np.array): Output values at the samples.
+
+    Notes:
+        Module-level so it can be dispatched to worker processes.
+    """
+    response_all = problem.evaluate(samples,return_values_of=results,return_as_dictionary=True) # return_values_of doesn't work as expected
+    response = np.concatenate([column_data for column, column_data in response_all.items() if column in results], axis=1)
+
+    return response
+
 class EvaluatorData(Evaluator):
     """
     Obtain the response from a data file.
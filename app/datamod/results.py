@@ -4,6 +4,7 @@ This module contains functions to handle the results database.
 
 # Import native packages
 import os
+from shutil import copyfileobj
 
 # Import pypi packages
 import numpy as np
@@ -57,31 +58,38 @@ def make_data_file(file,dim_in,n_obj,n_constr):
 def write_results(file,inputs,outputs):
     """
     Write the samples to the database.
-    
+
     Args:
+        file (str/file): Path and name of the database file, or an open handle.
         inputs (np.array): Input coordinates.
         outputs (np.array): Output coordinates.
     """
     all_data = np.concatenate((inputs,outputs),1)
 
-    with open(file, 'a') as f:
-        np.savetxt(f,all_data,delimiter=",")
+    if hasattr(file,"write"):
+        np.savetxt(file,all_data,delimiter=",")
+    else:
+        with open(file, 'a') as f:
+            np.savetxt(f,all_data,delimiter=",")
     
-def load_results(file):
+def load_results(file,skiprows=0):
     """
     Loads the data from the result database.
-    
+
     Args:
         file (str): Path and name of the database file.
+        skiprows (int): Number of data rows to skip, for incremental reads.
 
     Returns:
         dim_in (int): Number of input dimensions.
-        col_names (np.array): Name if stored variables.        
-        data (np.array): Samples.        
+        col_names (np.array): Name if stored variables.
+        data (np.array): Samples.
     """
-    dim_in = int(np.loadtxt(file,max_rows=1))
-    col_names = np.loadtxt(file,skiprows=1,max_rows=1,dtype=str,delimiter=",")
-    data = np.loadtxt(file,skiprows=2,delimiter=",")
+    # Parse the file in a single pass instead of one scan per section
+    with open(file, 'r') as f:
+        dim_in = int(f.readline())
+        col_names = np.array(f.readline().rstrip("\n").split(","))
+        data = np.loadtxt(f,delimiter=",",skiprows=skiprows)
 
     return dim_in, col_names, data
 
@@ -107,15 +115,33 @@ def header_names(dim_in,n_obj,n_const):
 
     return headers
 
-def append_verification_to_database(file,verification_file):
+def append_verification_to_database(file,verification_file,verification=None):
     """
     Appends the results from the verification to the training database.
 
     Args:
         file (str): Path and name of the training database file.
         verification_file (str): Path and name of the verification database file.
+        verification (datamod.get_data): Already parsed verification samples.
+
+    Notes:
+        If the parsed verification samples are given, they are written directly
+        without re-reading the verification file. Otherwise the file content is
+        copied, using a kernel-side copy where the platform supports it.
     """
-    with open(file, 'a') as datafile:
-        with open(verification_file, 'r') as verifile:
-            read = "\n".join(verifile.read().split("\n")[2:])
-            datafile.write(read)
\ No newline at end of file
+    if verification is not None:
+        write_results(file,verification.coordinates,verification.response)
+        return
+
+    with open(file, 'r+b') as datafile:
+        with open(verification_file, 'rb') as verifile:
+            # Skip the dimension and header lines, then copy the remainder
+            verifile.readline()
+            verifile.readline()
+            datafile.seek(0,os.SEEK_END)
+            if hasattr(os,"sendfile"):
+                offset = verifile.tell()
+                count = os.fstat(verifile.fileno()).st_size - offset
+                os.sendfile(datafile.fileno(),verifile.fileno(),offset,count)
+            else:
+                copyfileobj(verifile,datafile)
\ No newline at end of file
@@ -14,7 +14,6 @@ import os
 
 # Import pypi packages
 import numpy as np
-from sklearn.preprocessing import minmax_scale
 from smt.sampling_methods import FullFactorial, LHS, Random
 from smt.sampling_methods.sampling_method import SamplingMethod
 
@@ -175,7 +174,10 @@ def sample_adaptive(data,samples,predictions,no_points_new,iteration):
     exploration, exploitation = adaptive_methods[adaptive_method]
 
     if exploration == "nnd":
-        exploration_metric = np.array([np.linalg.norm(data.input-sample,axis=1).min() for sample in samples])
+        # Pairwise squared distances via the binomial expansion, backed by a single matmul
+        squared_distances = np.sum(samples**2,1)[:,None] + np.sum(data.input**2,1)[None,:] - 2*samples@data.input.T
+        np.maximum(squared_distances,0,out=squared_distances) # guard against negative rounding errors
+        exploration_metric = np.sqrt(squared_distances.min(1))
     else:
         raise Exception("Exploration method not implemented")
 
@@ -207,12 +209,11 @@ def response_grid(density,inputs,ranges):
         ranges (np.array): Range of input variables.
 
     Returns:
-        sample_desired (np.array): Grid samples.    
+        sample_desired (np.array): Grid samples.
     """
-    n_dim = len(inputs)
-    no_points = density**n_dim
-    sample_unit = sample("grid",no_points,n_dim)
-    sample_desired = minmax_scale(sample_unit)*np.ptp(ranges[inputs,:],1)+np.min(ranges[inputs,:],1)
+    # Build the full tensor product grid by broadcasting, one axis per dimension
+    axes = [np.linspace(ranges[dim,0],ranges[dim,1],density) for dim in inputs]
+    sample_desired = np.stack(np.meshgrid(*axes,indexing="ij"),axis=-1).reshape(-1,len(inputs))
 
     return sample_desired
 
@@ -4,6 +4,7 @@ Surrogate package.
 The aim of the metamod package is to produce and run a surrogate model.
 """
 # Import native packages
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import os
 os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
@@ -54,35 +55,60 @@ def cross_validate(data,iteration,best_hp):
     validation = settings["surrogate"]["validation"]
     validation_param = settings["surrogate"]["validation_param"]
 
-    # Initialize training setup    
-    surrogates = []
+    # Initialize training setup
     split = set_validation(validation,validation_param)
     no_splits = split.get_n_splits()
+    n_jobs = settings["surrogate"]["n_jobs"] if "n_jobs" in settings["surrogate"].keys() else 1
 
     print(f"###### Training using {name} on {len(data.input)} examples ######")
 
-    # Train
-    for idx, (train, test) in enumerate(split.split(data.input)):
-        print(f"### Training model {idx+1}/{no_splits} ###")
-        model = set_surrogate(name,data.dim_in,data.dim_out)
-        model.train_in, model.train_out = data.input[train], data.output[train]
-        model.test_in, model.test_out = data.input[test], data.output[test]
-        model.set_training_values(model.train_in,model.train_out)
-        if name.startswith("ann"):
-            model.set_validation_values(model.test_in,model.test_out)
-            model.progress = [iteration,idx+1,no_splits]
-            model.CV = True
-            model.best_hp = best_hp
-        model.train()
-        model.metric = evaluate_metrics(model.test_in,model.test_out,model.predict_values)
-        model.metric["max_iterations"] = iteration
-        surrogates.append(model)
+    # Train, the folds are independent and can be fitted in parallel
+    folds = list(enumerate(split.split(data.input)))
+    if n_jobs != 1:
+        with ThreadPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None) as executor:
+            futures = [executor.submit(cross_validate_fold,name,data,iteration,best_hp,no_splits,idx,train,test) for idx, (train, test) in folds]
+            surrogates = [future.result() for future in futures]
+    else:
+        surrogates = [cross_validate_fold(name,data,iteration,best_hp,no_splits,idx,train,test) for idx, (train, test) in folds]
 
     if name.startswith("ann"):
         settings["surrogate"]["early_stop"] = int(np.mean([ann.early_stop for ann in surrogates]))
 
     return surrogates
 
+def cross_validate_fold(name,data,iteration,best_hp,no_splits,idx,train,test):
+    """
+    Train a single cross validation surrogate on its fold.
+
+    Args:
+        name (str): Name of the surrogate.
+        data (datamod.get_data): Training samples.
+        iteration (int): Iteration number.
+        best_hp (kerastuner.engine.hyperparameters.HyperParameters): Optimal hyperparameters.
+        no_splits (int): Total number of folds.
+        idx (int): Index of the fold.
+        train (np.array): Indices of the training samples.
+        test (np.array): Indices of the testing samples.
+
+    Returns:
+        model (object): Surrogate trained on the fold.
+    """
+    print(f"### Training model {idx+1}/{no_splits} ###")
+    model = set_surrogate(name,data.dim_in,data.dim_out)
+    model.train_in, model.train_out = data.input[train], data.output[train]
+    model.test_in, model.test_out = data.input[test], data.output[test]
+    model.set_training_values(model.train_in,model.train_out)
+    if name.startswith("ann"):
+        model.set_validation_values(model.test_in,model.test_out)
+        model.progress = [iteration,idx+1,no_splits]
+        model.CV = True
+        model.best_hp = best_hp
+    model.train()
+    model.metric = evaluate_metrics(model.test_in,model.test_out,model.predict_values)
+    model.metric["max_iterations"] = iteration
+
+    return model
+
 def train_surrogate(data,best_hp):
     """
 
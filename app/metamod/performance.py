@@ -72,9 +72,11 @@ def check_convergence(metrics):
     print("###### Evaluating sample size convergence ######")
     trained = False
     direction = convergence_operator()
+    criterion = settings["data"]["convergence"]
     threshold = settings["data"]["convergence_limit"]
-    
-    if settings["data"]["convergence_relative"]:
+    relative = settings["data"]["convergence_relative"]
+
+    if relative:
         window_size = 1 ###########
         if len(metrics) < 2:
             return False
@@ -88,7 +90,7 @@ def check_convergence(metrics):
        if direction(metrics[-1],threshold):
                 trained = True
 
-    print(f"Sample size convergence metric: {settings['data']['convergence']} - {metrics[-1]}")
+    print(f"Sample size convergence metric: {criterion} - {metrics[-1]}")
 
     return trained
 
@@ -117,9 +119,10 @@ def convergence_operator():
     Returns:
         op (function): Direction logical operator.
     """
-    if settings["data"]["convergence"] in ["mae","mse","rmse","medae","max_error"]:
+    criterion = settings["data"]["convergence"]
+    if criterion in ["mae","mse","rmse","medae","max_error"]:
         op = operator.lt
-    elif settings["data"]["convergence"] in ["max_iterations"]:
+    elif criterion in ["max_iterations"]:
         op = operator.gt
     else:
         raise Exception("Error should have been caught on initialization")
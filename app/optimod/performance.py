@@ -1,5 +1,8 @@
 """
 Module to access the performance of the optimization.
+
+Attributes:
+    rng (np.random.Generator): Shared random generator for verification sampling.
 """
 # Import native packages
 from math import ceil
@@ -27,6 +30,28 @@ def calculate_hypervolume(data,ref_point):
 
     return hv
 
+def measure_error(error,measure):
+    """
+    Reduce the verification error matrix to the selected scalar measure.
+
+    Args:
+        error (np.array): Benchmark percent error.
+        measure (str): Name of the selected measure.
+
+    Returns:
+        measured_error (float): Value of the selected measure.
+    """
+    if measure == "max":
+        measured_error = np.max(error)
+    elif measure == "mean":
+        measured_error = np.max(np.mean(error,0))
+    elif measure == "percentile":
+        measured_error = np.max(np.percentile(error,60,0,interpolation="lower"))
+    else:
+        raise Exception("Error should have been caught on initialization")
+
+    return measured_error
+
 def verify_results(results,surrogate):
     """
     Text.
@@ -39,17 +64,20 @@ def verify_results(results,surrogate):
         idx (np.array): Set of verification indices.
     """
     # Set the optimal solutions as new sample
-    results = np.atleast_2d(results)
+    if results.ndim != 2:
+        results = results[None,:]
     no_results = results.shape[0]
     verification_ratio = settings["optimization"]["verification_ratio"]
     no_verifications = ceil(no_results*verification_ratio)
 
     # Randomly select a verification sample
-    idx =  np.random.default_rng().choice(no_results,size=(no_verifications),replace=False)
+    idx =  rng.choice(no_results,size=(no_verifications),replace=False)
     surrogate.samples = results[idx]
     
     # Evaluate the samples and load the results
-    surrogate.evaluate_samples(verify=True) 
+    surrogate.evaluate_samples(verify=True)
     surrogate.load_results(verify=True)
 
     return idx
+
+rng = np.random.default_rng()
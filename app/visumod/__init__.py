@@ -66,17 +66,16 @@ def vis_objective_space_pcp(data,iteration):
     """
     pcp(data,f"optimization_{iteration}_objective_space_pcp")
 
-def compare_surrogate(inputs,outputs,predict,iteration):
+def compare_surrogate(outputs,predictions,iteration):
     """
     Plot the comparison of raw data and surrogate response.
 
     Args:
-        inputs (np.array): Input data.
         outputs (np.array): Output data.
-        predict (method): Predict method of the surrogate.
+        predictions (np.array): Surrogate response at the input data.
         iteration (int): Iteration number.
     """
-    data_all = np.stack((outputs.flatten(),predict(inputs).flatten()),1)
+    data_all = np.stack((outputs.flatten(),predictions.flatten()),1)
     scatter(data_all,f"iteration_{iteration}_surrogate",compare=True)
 
 def sample_size_convergence(metrics):